@@ -7,18 +7,48 @@ account. Region is pinned to us-east-1 (all picasso-* tables live there);
 credentials come from the ambient AWS_PROFILE (operator SSO).
 """
 import decimal
+import random
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 import boto3
 from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+from botocore.config import Config
 
 _REGION = "us-east-1"
 _serializer = TypeSerializer()
 _deserializer = TypeDeserializer()
 
+# One client for the whole run: keep-alive lets the many batch/query calls of a
+# full seed or reset ride the same TLS connections instead of re-handshaking,
+# and adaptive retries back off client-side when the table throttles. Timeouts
+# match docs/runbooks/ddb-rename-copy.py: short enough that a hung connection
+# becomes a retry instead of botocore's 60s default stall, but the read timeout
+# leaves headroom for a full 1MB query_all page (e.g. the session-events GSI
+# during reset) on a throttled table, so a slow-but-healthy page isn't cut off
+# and re-read from scratch.
+_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=2.0,
+    read_timeout=10.0,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+_client = None
+
+# Concurrent BatchWriteItem calls per write/delete. Kept well under the client's
+# connection pool so workers never wait on a socket.
+_BATCH_WORKERS = 8
+
+# BatchWriteItem calls per batch before unprocessed entries are a hard error.
+_BATCH_ATTEMPTS = 8
+
 
 def client():
-    return boto3.client("dynamodb", region_name=_REGION)
+    global _client
+    if _client is None:
+        _client = boto3.client("dynamodb", region_name=_REGION, config=_CONFIG)
+    return _client
 
 
 def _to_decimal(obj):
@@ -43,8 +73,70 @@ def unmarshal(av: dict) -> dict:
     return {k: _deserializer.deserialize(v) for k, v in av.items()}
 
 
+def _backoff(attempt: int) -> float:
+    """Equal-jitter delay after `attempt`: half the capped exponential step is
+    guaranteed, the other half is random so concurrent batches don't retry in
+    lockstep."""
+    cap = min(2 ** attempt * 0.1, 3.0)
+    return cap / 2 + random.uniform(0, cap / 2)
+
+
+def _send_batch(ddb, table: str, request: dict, what: str) -> None:
+    """BatchWriteItem one <=25-entry request, resubmitting UnprocessedItems with
+    jittered exponential backoff.
+
+    UnprocessedItems are throttling that botocore's adaptive retries never see,
+    so this loop is the only thing giving a throttled table time to drain:
+    _BATCH_ATTEMPTS allows at least 4.55s (6.8s expected) of backoff before
+    giving up, more than the 3.1s the old fixed schedule waited.
+    """
+    for attempt in range(_BATCH_ATTEMPTS):
+        resp = ddb.batch_write_item(RequestItems=request)
+        unprocessed = resp.get("UnprocessedItems") or {}
+        if not unprocessed:
+            return
+        request = unprocessed
+        if attempt + 1 < _BATCH_ATTEMPTS:
+            time.sleep(_backoff(attempt))
+    raise RuntimeError(f"{table}: unprocessed {what} remained after retries")
+
+
+def _send_batches(table: str, requests: list, what: str) -> None:
+    """Send every request via _send_batch on a bounded thread pool (the boto3
+    client is thread-safe), overlapping round-trips.
+
+    Fails fast: on the first batch to raise, batches not yet started are
+    cancelled (only the <= _BATCH_WORKERS already in flight finish) and that
+    exception is re-raised, so a throttled table or bad key on `reset --live`
+    doesn't keep deleting the rest of the table before the operator sees it.
+    """
+    ddb = client()
+    errors = []  # in the order they were raised (list.append is atomic)
+
+    def send(request):
+        if errors:  # a batch already failed; don't start new ones
+            return
+        try:
+            _send_batch(ddb, table, request, what)
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    pool = ThreadPoolExecutor(max_workers=_BATCH_WORKERS)
+    try:
+        pending = {pool.submit(send, r) for r in requests}
+        while pending and not errors:
+            _, pending = wait(pending, return_when=FIRST_EXCEPTION)
+        for f in pending:
+            f.cancel()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    if errors:
+        raise errors[0]
+
+
 def batch_write(table: str, items: list, dry_run: bool, label: str = "") -> int:
-    """PutItem `items` into `table` in batches of 25 with backoff on
+    """PutItem `items` into `table` in concurrent batches of 25 with backoff on
     UnprocessedItems. Returns the number of rows written (0 in dry_run).
     """
     tag = label or table
@@ -53,21 +145,12 @@ def batch_write(table: str, items: list, dry_run: bool, label: str = "") -> int:
         return 0
     if not items:
         return 0
-    ddb = client()
-    written = 0
-    for i in range(0, len(items), 25):
-        chunk = items[i : i + 25]
-        request = {table: [{"PutRequest": {"Item": marshal(it)}} for it in chunk]}
-        for attempt in range(6):
-            resp = ddb.batch_write_item(RequestItems=request)
-            unprocessed = resp.get("UnprocessedItems") or {}
-            if not unprocessed:
-                break
-            request = unprocessed
-            time.sleep(min(2 ** attempt * 0.1, 3.0))
-        else:
-            raise RuntimeError(f"{table}: unprocessed items remained after retries")
-        written += len(chunk)
+    requests = [
+        {table: [{"PutRequest": {"Item": marshal(it)}} for it in items[i : i + 25]]}
+        for i in range(0, len(items), 25)
+    ]
+    _send_batches(table, requests, "items")
+    written = len(items)
     print(f"  wrote {written} rows -> {table} ({tag})")
     return written
 
@@ -110,20 +193,11 @@ def batch_delete(table: str, keys: list, dry_run: bool, label: str = "") -> int:
         return 0
     if not keys:
         return 0
-    ddb = client()
-    deleted = 0
-    for i in range(0, len(keys), 25):
-        chunk = keys[i : i + 25]
-        request = {table: [{"DeleteRequest": {"Key": marshal(k)}} for k in chunk]}
-        for attempt in range(6):
-            resp = ddb.batch_write_item(RequestItems=request)
-            unprocessed = resp.get("UnprocessedItems") or {}
-            if not unprocessed:
-                break
-            request = unprocessed
-            time.sleep(min(2 ** attempt * 0.1, 3.0))
-        else:
-            raise RuntimeError(f"{table}: unprocessed deletes remained after retries")
-        deleted += len(chunk)
+    requests = [
+        {table: [{"DeleteRequest": {"Key": marshal(k)}} for k in keys[i : i + 25]]}
+        for i in range(0, len(keys), 25)
+    ]
+    _send_batches(table, requests, "deletes")
+    deleted = len(keys)
     print(f"  deleted {deleted} rows <- {table} ({tag})")
     return deleted
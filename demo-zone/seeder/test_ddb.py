@@ -0,0 +1,145 @@
+"""Unit tests for demo-zone/seeder/ddb.py — the concurrent BatchWriteItem path
+behind batch_write / batch_delete (and so `seed.py reset --live`).
+
+A stub client stands in for boto3's DynamoDB client, so no AWS access is
+needed. Covers: every row lands in exactly one batch, UnprocessedItems are
+resubmitted, and a failing batch stops the run instead of letting the rest of
+the queued batches keep writing/deleting.
+
+Run: python3 -m pytest demo-zone/seeder/test_ddb.py -v
+"""
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import ddb  # noqa: E402
+
+TABLE = "picasso-test"
+
+
+class StubClient:
+    """Records every batch_write_item call; `behaviour(request)` may raise or
+    return UnprocessedItems."""
+
+    def __init__(self, behaviour=None):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._behaviour = behaviour
+
+    def batch_write_item(self, RequestItems):
+        with self._lock:
+            self.calls.append(RequestItems)
+        if self._behaviour:
+            return self._behaviour(RequestItems) or {}
+        return {}
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    def install(behaviour=None):
+        client = StubClient(behaviour)
+        monkeypatch.setattr(ddb, "_client", client)
+        monkeypatch.setattr(ddb.time, "sleep", lambda s: None)  # no backoff wait
+        return client
+    return install
+
+
+def _keys(n):
+    return [{"pk": "TENANT#t", "sk": f"S#{i:05d}"} for i in range(n)]
+
+
+def _sks(request):
+    return [e["DeleteRequest"]["Key"]["sk"]["S"] for e in request[TABLE]]
+
+
+# ─── Coverage ───────────────────────────────────────────────────────────────
+
+def test_batch_delete_sends_every_key_exactly_once_in_25_item_batches(stub):
+    client = stub()
+    assert ddb.batch_delete(TABLE, _keys(60), dry_run=False) == 60
+    sizes = sorted(len(r[TABLE]) for r in client.calls)
+    assert sizes == [10, 25, 25]
+    sent = sorted(sk for r in client.calls for sk in _sks(r))
+    assert sent == [k["sk"] for k in _keys(60)]
+
+
+def test_batch_write_sends_every_item_exactly_once(stub):
+    client = stub()
+    items = [{"pk": "p", "sk": str(i), "score": 1.5} for i in range(51)]
+    assert ddb.batch_write(TABLE, items, dry_run=False) == 51
+    sent = sorted(e["PutRequest"]["Item"]["sk"]["S"] for r in client.calls for e in r[TABLE])
+    assert sent == sorted(str(i) for i in range(51))
+
+
+def test_unprocessed_items_are_resubmitted(stub):
+    first = threading.Event()
+
+    def behaviour(request):
+        # The very first call leaves its last entry unprocessed.
+        if not first.is_set():
+            first.set()
+            return {"UnprocessedItems": {TABLE: request[TABLE][-1:]}}
+        return {}
+
+    client = stub(behaviour)
+    ddb.batch_delete(TABLE, _keys(5), dry_run=False)
+    assert len(client.calls) == 2
+    assert _sks(client.calls[1]) == _sks(client.calls[0])[-1:]
+
+
+def test_persistent_unprocessed_items_raise_after_the_attempt_cap(stub, monkeypatch):
+    sleeps = []
+    client = stub(lambda request: {"UnprocessedItems": request})
+    monkeypatch.setattr(ddb.time, "sleep", sleeps.append)
+    with pytest.raises(RuntimeError, match="unprocessed deletes remained"):
+        ddb.batch_delete(TABLE, _keys(5), dry_run=False)
+    assert len(client.calls) == ddb._BATCH_ATTEMPTS
+    # Sleep only between attempts, never after the last one.
+    assert len(sleeps) == ddb._BATCH_ATTEMPTS - 1
+
+
+def test_backoff_keeps_a_floor_and_the_old_total_wait(monkeypatch):
+    monkeypatch.setattr(ddb.random, "uniform", lambda a, b: a)  # worst case: no jitter
+    floors = [ddb._backoff(a) for a in range(ddb._BATCH_ATTEMPTS - 1)]
+    assert floors[0] == pytest.approx(0.05)
+    assert max(floors) == pytest.approx(1.5)
+    # Even with zero jitter the total wait beats the old fixed 3.1s schedule.
+    assert sum(floors) >= 3.1
+
+
+def test_dry_run_sends_nothing(stub):
+    client = stub()
+    assert ddb.batch_delete(TABLE, _keys(30), dry_run=True) == 0
+    assert client.calls == []
+
+
+# ─── Fail-fast ──────────────────────────────────────────────────────────────
+
+def test_failing_batch_stops_the_run_before_queued_batches_are_sent(stub):
+    def behaviour(request):
+        raise RuntimeError("throttled")
+
+    client = stub(behaviour)
+    with pytest.raises(RuntimeError, match="throttled"):
+        ddb.batch_delete(TABLE, _keys(200 * 25), dry_run=False)
+    # Only batches already in flight when the first one failed may run.
+    assert len(client.calls) <= ddb._BATCH_WORKERS
+
+
+def test_reraises_the_failure_that_happened_first_not_the_first_submitted(stub):
+    early_raised = threading.Event()
+
+    def behaviour(request):
+        if _sks(request)[0] == "S#00000":
+            # First-submitted batch fails, but only after the second one has.
+            early_raised.wait(timeout=5)
+            raise RuntimeError("late")
+        early_raised.set()
+        raise RuntimeError("early")
+
+    stub(behaviour)
+    with pytest.raises(RuntimeError, match="early"):
+        ddb.batch_delete(TABLE, _keys(50), dry_run=False)
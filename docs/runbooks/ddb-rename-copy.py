@@ -29,8 +29,18 @@ import sys
 import time
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Keep-alive + adaptive retries for the long scan/batch-write loop; bounded
+# socket timeouts so a stalled connection retries instead of hanging for 60s.
+DDB_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=2.0,
+    read_timeout=10.0,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
 
 def die(msg: str) -> None:
     print(f"ABORT: {msg}", file=sys.stderr)
@@ -65,7 +75,7 @@ def main() -> None:
             f"Refusing (wrong profile/account). No data touched.")
     print(f"[guard] account {acct} OK (arn={ident['Arn']})")
 
-    ddb = session.client("dynamodb")
+    ddb = session.client("dynamodb", config=DDB_CONFIG)
 
     # --- Confirm both tables exist + dest is empty (unless overridden) -------
     try:
@@ -6,7 +6,7 @@
 // Kept byte-identical between the staging and prod signer modules (per-account twins).
 const test = require('node:test');
 const assert = require('node:assert');
-const { handler, signedHeaders, canonicalizeQuery } = require('./src/index.js');
+const { handler, signedHeaders, canonicalizeQuery, signingKey } = require('./src/index.js');
 
 function setCreds() {
   process.env.AWS_ACCESS_KEY_ID = 'AKIDEXAMPLE';
@@ -105,6 +105,23 @@ test('empty / undefined query → empty canonical string', () => {
   assert.strictEqual(canonicalizeQuery(undefined), '');
 });
 
+// --- signingKey memoization ---
+
+test('signingKey reuses the derived key for the same secret + day', () => {
+  const a = signingKey('secret', '20260606');
+  const b = signingKey('secret', '20260606');
+  assert.strictEqual(a, b, 'same Buffer returned from the warm-container cache');
+});
+
+test('signingKey re-derives when the day or the secret changes', () => {
+  const day1 = signingKey('secret', '20260606');
+  const day2 = signingKey('secret', '20260607');
+  const rotated = signingKey('rotated', '20260607');
+  assert.notDeepStrictEqual(day1, day2);
+  assert.notDeepStrictEqual(day2, rotated);
+  assert.deepStrictEqual(signingKey('secret', '20260606'), day1, 'same inputs derive the same key again');
+});
+
 // --- signedHeaders determinism (golden) ---
 
 test('signedHeaders is deterministic for fixed time/creds/body', () => {
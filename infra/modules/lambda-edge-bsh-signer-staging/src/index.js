@@ -12,11 +12,20 @@ const SERVICE = 'lambda';
 const sha256hex = (b) => crypto.createHash('sha256').update(b).digest('hex');
 const hmac = (key, str) => crypto.createHmac('sha256', key).update(str).digest();
 
+// The derived key depends only on (secret, day), so a warm container re-derives
+// it once per UTC day / credential rotation instead of 4 HMACs on every request.
+let cachedKey = null;
+
 function signingKey(secret, dateStamp) {
+  if (cachedKey && cachedKey.secret === secret && cachedKey.dateStamp === dateStamp) {
+    return cachedKey.key;
+  }
   const kDate = hmac('AWS4' + secret, dateStamp);
   const kRegion = hmac(kDate, REGION);
   const kService = hmac(kRegion, SERVICE);
-  return hmac(kService, 'aws4_request');
+  const key = hmac(kService, 'aws4_request');
+  cachedKey = { secret, dateStamp, key };
+  return key;
 }
 
 // RFC3986 percent-encoding per SigV4 (encodeURIComponent leaves !*'() unencoded).
@@ -151,3 +160,4 @@ exports.handler = async (event) => {
 // Exported for unit tests (Lambda@Edge only invokes `handler`).
 exports.signedHeaders = signedHeaders;
 exports.canonicalizeQuery = canonicalizeQuery;
+exports.signingKey = signingKey;